@@ -6,28 +6,141 @@ This module handles:
 - AI model interaction via official Anthropic SDK
 - Response parsing
 - Retry logic for robustness
+- Caching of results so duplicate tickets skip the AI call
 - Fallback strategies when AI is unavailable
 
 The module is designed to be resilient and always return a result,
 even if the AI service is unavailable.
 """
 
+import hashlib
 import logging
+import random
+import re
+import threading
 import time
-from anthropic import Anthropic, APIError, APIConnectionError, RateLimitError
+from functools import lru_cache
+import ahocorasick
+import httpx
+from anthropic import Anthropic, NOT_GIVEN, APIError, APIConnectionError, APIStatusError, RateLimitError
 from config import (
     DEPARTMENTS,
     AI_MAX_RETRIES,
     AI_RETRY_DELAY,
+    AI_CONNECTION_RETRY_DELAY,
+    AI_MAX_RETRY_DELAY,
     AI_DEFAULT_CONFIDENCE,
     AI_FALLBACK_CONFIDENCE,
+    AI_CACHE_SIZE,
+    AI_BATCH_SIZE,
+    AI_BATCH_TOKENS_PER_TICKET,
+    AI_REQUESTS_PER_MINUTE,
+    AI_INPUT_TOKENS_PER_MINUTE,
+    AI_SHORTCUT_MIN_SCORE,
+    AI_SHORTCUT_MIN_GAP,
+    AI_SHORTCUT_CONFIDENCE,
     CLAUDE_API_KEY,
     CLAUDE_MODEL,
-    CLAUDE_MAX_TOKENS
+    CLAUDE_MAX_TOKENS,
+    CLAUDE_TIMEOUT,
+    CLAUDE_MAX_CONNECTIONS,
+    CLAUDE_MAX_KEEPALIVE_CONNECTIONS
 )
+from database import get_cached_categorization, save_cached_categorization
 
 logger = logging.getLogger(__name__)
 
+# Shared Claude client (created lazily, see _get_client)
+_client = None
+_client_lock = threading.Lock()
+
+
+class LeakyBucket:
+    """
+    Thread-safe rate limiter that spreads usage evenly over time.
+
+    Capacity refills continuously at the configured rate per minute, up to
+    one minute's worth. acquire() reserves capacity and sleeps until the
+    reservation is covered, so concurrent callers queue up in order.
+    """
+
+    def __init__(self, per_minute):
+        self.base_rate = per_minute / 60.0  # units per second
+        self.rate = self.base_rate
+        self.capacity = float(per_minute)
+        self._level = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, cost):
+        """
+        Reserve capacity without waiting.
+
+        Returns:
+            float: Seconds until the reservation is covered
+        """
+        with self._lock:
+            self._refill()
+            self._level -= cost
+            return -self._level / self.rate if self._level < 0 else 0.0
+
+    def scale_rate(self, factor, minimum=0.1):
+        """Scale the refill rate, keeping it between minimum and 1x the base rate."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.base_rate * minimum, min(self.base_rate, self.rate * factor))
+
+
+class RateGovernor:
+    """
+    Keeps AI calls under both the requests-per-minute and the
+    input-tokens-per-minute limits of the API tier
+    (prompt tokens are estimated at four characters per token).
+
+    On a 429 the rates shrink by 20%, and they grow back by 5% after each
+    successful call. Limits are per process; config.py gives each gunicorn
+    worker its share of the account limits (see AI_RATE_LIMIT_PROCESSES).
+    """
+
+    def __init__(self, requests_per_minute, tokens_per_minute):
+        self.requests = LeakyBucket(requests_per_minute)
+        self.tokens = LeakyBucket(tokens_per_minute)
+
+    def acquire(self, estimated_tokens):
+        """
+        Block until a call costing estimated_tokens may be sent.
+
+        The cost is capped at one minute's worth of tokens, so a single
+        oversized prompt waits at most a minute and cannot push back every
+        call queued behind it for longer than that.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        estimated_tokens = min(estimated_tokens, self.tokens.capacity)
+        wait = max(self.requests.reserve(1), self.tokens.reserve(estimated_tokens))
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def throttle(self):
+        """Slow down after the API reported a rate limit."""
+        self.requests.scale_rate(0.8)
+        self.tokens.scale_rate(0.8)
+
+    def recover(self):
+        """Speed back up towards the configured limits after a success."""
+        self.requests.scale_rate(1.05)
+        self.tokens.scale_rate(1.05)
+
+
+_governor = RateGovernor(AI_REQUESTS_PER_MINUTE, AI_INPUT_TOKENS_PER_MINUTE)
+
 
 def categorize_ticket(title, description):
     """
@@ -44,77 +157,345 @@ def categorize_ticket(title, description):
         tuple: (department_name, confidence_score)
                Always returns a valid department, defaults to 'General' on failure
     """
+    # Tickets the keyword matcher can decide with certainty skip the AI
+    shortcut = _keyword_shortcut(title, description)
+    if shortcut is not None:
+        logger.info("Keyword shortcut: %s (confidence: %s%%)", shortcut[0], shortcut[1])
+        return shortcut
+
+    # Identical tickets (automated "password reset" style reports) reuse
+    # the stored result instead of paying for another AI round-trip
+    cache_key = _cache_key(title, description)
+    cached = _lookup_cached_categorization(cache_key)
+    if cached is not None:
+        logger.info("Cache hit: %s (confidence: %s%%)", cached[0], cached[1])
+        return cached
+
     # Build the prompt for the AI
     prompt = _build_categorization_prompt(title, description)
 
     # Try to get AI categorization with retries
+    result = _request_categorization(
+        prompt,
+        _parse_single_response,
+        stop_sequences=_SINGLE_TICKET_STOP_SEQUENCES
+    )
+    if result is not None:
+        department, confidence = result
+        logger.info("Categorized as: %s (confidence: %s%%)", department, confidence)
+        _store_cached_categorization(cache_key, department, confidence)
+        return department, confidence
+
+    # All attempts failed - use fallback strategy
+    logger.warning("All AI categorization attempts failed, using fallback")
+    return _fallback_categorization(title, description)
+
+
+def categorize_tickets_batch(items):
+    """
+    Categorize several tickets with a single AI request.
+
+    Used for bulk ingestion (imports, email-to-ticket sync). Instead of one
+    API round-trip per ticket, the tickets are numbered in one prompt and
+    the AI answers with one line per ticket, amortizing the per-request
+    overhead across the whole batch. Cached tickets are skipped, and any
+    ticket missing from the AI response falls back to keyword matching.
+
+    Args:
+        items: List of (title, description) tuples
+
+    Returns:
+        list: (department_name, confidence_score) tuples in the same order
+              as items
+    """
+    results = [None] * len(items)
+
+    # Only tickets that are neither obvious nor categorized before go to the AI
+    pending = []
+    for index, (title, description) in enumerate(items):
+        shortcut = _keyword_shortcut(title, description)
+        if shortcut is not None:
+            results[index] = shortcut
+            continue
+
+        cache_key = _cache_key(title, description)
+        cached = _lookup_cached_categorization(cache_key)
+        if cached is not None:
+            results[index] = cached
+        else:
+            pending.append((index, cache_key))
+
+    logger.info("Batch categorization: %s resolved without AI, %s to categorize", len(items) - len(pending), len(pending))
+
+    for start in range(0, len(pending), AI_BATCH_SIZE):
+        chunk = pending[start:start + AI_BATCH_SIZE]
+        prompt = _build_batch_categorization_prompt([items[index] for index, _ in chunk])
+
+        parsed = _request_categorization(
+            prompt,
+            lambda text: _parse_batch_response(text, len(chunk)),
+            max_tokens=AI_BATCH_TOKENS_PER_TICKET * len(chunk)
+        ) or {}
+
+        for number, (index, cache_key) in enumerate(chunk, 1):
+            if number in parsed:
+                department, confidence = parsed[number]
+                _store_cached_categorization(cache_key, department, confidence)
+                results[index] = (department, confidence)
+            else:
+                logger.warning("No AI result for batch ticket %s, using fallback", number)
+                results[index] = _fallback_categorization(*items[index])
+
+    return results
+
+
+def _request_categorization(prompt, parse_response, max_tokens=CLAUDE_MAX_TOKENS, stop_sequences=None):
+    """
+    Send a prompt to the AI, retrying until a usable response is parsed.
+
+    Args:
+        prompt: The prompt to send to the AI
+        parse_response: Function turning the response text into a result,
+                        or None if the response is unusable
+        max_tokens: Max tokens for the AI response
+        stop_sequences: Optional strings that end the AI response early
+
+    Returns:
+        The parsed result, or None if all attempts failed
+    """
     for attempt in range(AI_MAX_RETRIES):
         try:
-            logger.info(f"AI categorization attempt {attempt + 1}/{AI_MAX_RETRIES}")
+            logger.info("AI categorization attempt %s/%s", attempt + 1, AI_MAX_RETRIES)
 
             # Call AI service
-            response_text = _call_ai_service(prompt)
+            response_text = _call_ai_service(prompt, max_tokens, stop_sequences)
 
             # Parse the response
-            department, confidence = _parse_ai_response(response_text)
-
-            # Validate and return if successful
-            if department and department in DEPARTMENTS:
-                if confidence is None:
-                    confidence = AI_DEFAULT_CONFIDENCE
-                logger.info(f"Categorized as: {department} (confidence: {confidence}%)")
-                return department, confidence
-            else:
-                logger.warning(f"Invalid department in response: {department}")
+            result = parse_response(response_text)
+            if result is not None:
+                return result
 
         except Exception as e:
-            logger.error(f"AI categorization error (attempt {attempt + 1}): {e}")
+            logger.error("AI categorization error (attempt %s): %s", attempt + 1, e)
+
+            # Hard errors (bad request, auth, missing key) will not succeed on retry
+            delay = _retry_delay(e, attempt)
+            if delay is None:
+                logger.warning("AI error is not retryable, skipping remaining attempts")
+                break
 
             # Wait before retrying (except on last attempt)
             if attempt < AI_MAX_RETRIES - 1:
-                time.sleep(AI_RETRY_DELAY)
+                logger.info("Retrying AI categorization in %.1fs", delay)
+                time.sleep(delay)
 
-    # All attempts failed - use fallback strategy
-    logger.warning("All AI categorization attempts failed, using fallback")
-    return _fallback_categorization(title, description)
+    return None
 
 
-def _build_categorization_prompt(title, description):
+def _retry_delay(error, attempt):
     """
-    Build the prompt for AI categorization.
+    Work out how long to wait before retrying after an AI error.
+
+    - Rate limits (429): honor the Retry-After header, otherwise back off
+    - Connection errors and timeouts: shorter exponential backoff
+    - Server errors (5xx): exponential backoff
+    - Anything else (4xx, missing API key, ...): not retryable
+
+    Args:
+        error: Exception raised by the AI call
+        attempt: Zero-based attempt number that failed
+
+    Returns:
+        float: Seconds to wait, or None if the error should not be retried
+    """
+    if isinstance(error, RateLimitError):
+        retry_after = _parse_retry_after(error.response)
+        if retry_after is not None:
+            return min(retry_after, AI_MAX_RETRY_DELAY)
+        return _backoff_delay(AI_RETRY_DELAY, attempt)
+
+    if isinstance(error, APIConnectionError):
+        return _backoff_delay(AI_CONNECTION_RETRY_DELAY, attempt)
+
+    if isinstance(error, APIStatusError) and error.status_code >= 500:
+        return _backoff_delay(AI_RETRY_DELAY, attempt)
+
+    return None
+
+
+def _backoff_delay(base_delay, attempt):
+    """
+    Exponential backoff capped at AI_MAX_RETRY_DELAY, plus up to 20% jitter
+    so concurrent workers do not retry in lockstep.
+    """
+    delay = min(base_delay * 2 ** attempt, AI_MAX_RETRY_DELAY)
+    return delay + random.uniform(0, 0.2 * delay)
+
+
+def _parse_retry_after(response):
+    """
+    Read the Retry-After header (in seconds) from an API response.
+
+    Returns:
+        float: Seconds to wait, or None if the header is missing or invalid
+    """
+    try:
+        return max(0.0, float(response.headers.get('retry-after')))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _cache_key(title, description):
+    """
+    Build the cache key for a ticket.
+
+    Titles and descriptions can be long, so they are hashed down to a
+    16-byte digest which is cheap to compare and to store in SQLite.
 
     Args:
         title: Ticket title
         description: Ticket description
 
     Returns:
-        str: Formatted prompt for the AI
+        bytes: 16-byte digest identifying the ticket text
     """
-    prompt = f"""Categorize this support ticket into exactly one of these departments: IT Support, HR, Facilities, Finance, or General.
+    text = f"{title}\x00{description}"
+    return hashlib.sha256(text.encode('utf-8')).digest()[:16]
 
-Ticket Title: {title}
-Ticket Description: {description}
 
-Respond in this exact format:
-Department: [department name]
-Confidence: [number from 0-100]
+@lru_cache(maxsize=AI_CACHE_SIZE)
+def _cached_categorization(cache_key):
+    """
+    Fetch a stored categorization, keeping recent hits in memory.
+
+    Misses raise KeyError rather than returning None: lru_cache does not
+    cache exceptions, so a ticket that is categorized later is still
+    picked up from the database on the next lookup.
 
-Rules:
+    Raises:
+        KeyError: If the ticket has not been categorized before
+    """
+    result = get_cached_categorization(cache_key)
+    if result is None:
+        raise KeyError(cache_key)
+    return result
+
+
+def _lookup_cached_categorization(cache_key):
+    """
+    Look up a cached categorization without letting cache errors
+    interfere with categorization.
+
+    Returns:
+        tuple: (department_name, confidence_score) or None on a miss
+    """
+    try:
+        return _cached_categorization(cache_key)
+    except KeyError:
+        return None
+    except Exception as e:
+        logger.warning("Categorization cache lookup failed: %s", e)
+        return None
+
+
+def _store_cached_categorization(cache_key, department, confidence):
+    """
+    Persist an AI categorization so it survives restarts.
+
+    Fallback results are never stored - they should be retried with
+    the AI once it becomes available again.
+    """
+    try:
+        save_cached_categorization(cache_key, department, confidence)
+    except Exception as e:
+        logger.warning("Failed to cache categorization: %s", e)
+
+
+_CATEGORIZATION_RULES = """Rules:
 - IT Support: Technical issues, software, hardware, network, passwords, computers, internet, email, applications
 - HR: Employee relations, benefits, payroll, hiring, leave, training, performance reviews, workplace issues
 - Facilities: Building maintenance, office space, equipment, cleaning, parking, security, temperature
 - Finance: Budgets, expenses, invoicing, purchasing, reimbursements, accounting, financial reports
 - General: Everything else that doesn't fit above categories"""
 
-    return prompt
+# Instructions shared by every request. They are sent ahead of the ticket
+# text so the API can cache them as a common prompt prefix.
+_SINGLE_TICKET_INSTRUCTIONS = f"""Categorize the support ticket below into exactly one of these departments: IT Support, HR, Facilities, Finance, or General.
+
+Output ONLY these two lines:
+Department: [department name]
+Confidence: [number from 0-100]
+
+{_CATEGORIZATION_RULES}"""
+
+# The two answer lines are all we need; stop before any explanation
+_SINGLE_TICKET_STOP_SEQUENCES = ["\n\n", "Rules:"]
+
+_BATCH_INSTRUCTIONS = f"""Categorize each of the support tickets below into exactly one of these departments: IT Support, HR, Facilities, Finance, or General.
+
+Respond with one line per ticket in this exact format:
+[ticket number]: [department name] | [confidence number from 0-100]
+
+{_CATEGORIZATION_RULES}"""
+
+# "Department: ..." and "Confidence: ..." lines of a single-ticket response
+_DEPARTMENT_LINE_RE = re.compile(r'^\s*Department:\s*(.+?)\s*$', re.MULTILINE | re.IGNORECASE)
+_CONFIDENCE_LINE_RE = re.compile(r'^\s*Confidence:\s*(\d+)', re.MULTILINE | re.IGNORECASE)
+
+# Case-insensitive lookup of department names written by the AI
+_DEPARTMENTS_BY_NAME = {dept.lower(): dept for dept in DEPARTMENTS}
+
+# One "<number>: <department> | <confidence>" line of a batch response
+_BATCH_LINE_RE = re.compile(r'^\s*(\d+)[:.)]\s*([A-Za-z][A-Za-z ]*?)\s*\|\s*(\d+)', re.MULTILINE)
+
+
+def _build_categorization_prompt(title, description):
+    """
+    Build the prompt for AI categorization.
+
+    Args:
+        title: Ticket title
+        description: Ticket description
+
+    Returns:
+        tuple: (static_instructions, ticket_text) - see _call_ai_service
+    """
+    ticket = f"""Ticket Title: {title}
+Ticket Description: {description}"""
+
+    return _SINGLE_TICKET_INSTRUCTIONS, ticket
+
+
+def _build_batch_categorization_prompt(items):
+    """
+    Build the prompt for categorizing several tickets at once.
+
+    Args:
+        items: List of (title, description) tuples
+
+    Returns:
+        tuple: (static_instructions, ticket_text) - see _call_ai_service
+    """
+    tickets = "\n".join(
+        f"{number}) Title: {title}\n   Description: {description}"
+        for number, (title, description) in enumerate(items, 1)
+    )
+
+    return _BATCH_INSTRUCTIONS, tickets
 
 
-def _call_ai_service(prompt):
+def _call_ai_service(prompt, max_tokens=CLAUDE_MAX_TOKENS, stop_sequences=None):
     """
     Make a call to the Claude API using the official Anthropic SDK.
 
+    The static instructions are marked for prompt caching, so repeated
+    calls only pay full price for the ticket text that follows them.
+
     Args:
-        prompt: The prompt to send to the AI
+        prompt: (static_instructions, ticket_text) tuple from one of the
+                prompt builders
+        max_tokens: Max tokens for the AI response
+        stop_sequences: Optional strings that end the AI response early
 
     Returns:
         str: AI response text
@@ -125,42 +506,109 @@ def _call_ai_service(prompt):
     if not CLAUDE_API_KEY:
         raise ValueError("CLAUDE_API_KEY environment variable is not set")
 
+    # Wait for room under the API rate limits before sending, rather
+    # than finding out from a 429 afterwards
+    instructions, ticket_text = prompt
+    waited = _governor.acquire((len(instructions) + len(ticket_text)) // 4)
+    if waited > 0:
+        logger.info("Rate governor delayed AI call by %.1fs", waited)
+
     try:
-        # Create Anthropic client with explicit configuration
-        # Note: Some versions don't support proxies parameter, so we just use api_key
-        client = Anthropic(
-            api_key=CLAUDE_API_KEY,
-            timeout=30.0  # 30 second timeout for API calls
-        )
+        client = _get_client()
 
         response = client.messages.create(
             model=CLAUDE_MODEL,
-            max_tokens=CLAUDE_MAX_TOKENS,
+            max_tokens=max_tokens,
+            stop_sequences=stop_sequences or NOT_GIVEN,
             messages=[
-                {"role": "user", "content": prompt}
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": instructions,
+                            "cache_control": {"type": "ephemeral"}
+                        },
+                        {"type": "text", "text": ticket_text}
+                    ]
+                }
             ]
         )
 
         response_text = response.content[0].text.strip()
-        logger.info(f"AI Response: {response_text}")
+        # Full responses are only useful when debugging prompts
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("AI Response: %s", response_text)
 
+        _governor.recover()
         return response_text
 
     except RateLimitError as e:
-        logger.error(f"Rate limit exceeded: {e}")
+        logger.error("Rate limit exceeded: %s", e)
+        _governor.throttle()
         raise
     except APIConnectionError as e:
-        logger.error(f"API connection error: {e}")
+        logger.error("API connection error: %s", e)
         raise
     except APIError as e:
-        logger.error(f"API error: {e}")
+        logger.error("API error: %s", e)
         raise
     except TypeError as e:
         # Handle initialization errors (like proxy parameter issues)
-        logger.error(f"Client initialization error: {e}")
+        logger.error("Client initialization error: %s", e)
         raise
 
 
+def _get_client():
+    """
+    Get the shared Anthropic client, creating it on first use.
+
+    A single client backed by a pooled httpx.Client keeps connections to
+    the API alive between tickets, so retries and subsequent tickets skip
+    DNS resolution and the TLS handshake. Creation is lazy so tests can
+    replace the client before it is built.
+
+    Returns:
+        Anthropic: The shared client
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=CLAUDE_MAX_CONNECTIONS,
+                        max_keepalive_connections=CLAUDE_MAX_KEEPALIVE_CONNECTIONS
+                    ),
+                    timeout=CLAUDE_TIMEOUT
+                )
+                # Retries are handled by categorize_ticket, so the SDK's
+                # own retry loop is disabled to avoid compounding them
+                _client = Anthropic(
+                    api_key=CLAUDE_API_KEY,
+                    http_client=http_client,
+                    timeout=CLAUDE_TIMEOUT,
+                    max_retries=0
+                )
+    return _client
+
+
+def reset_client():
+    """
+    Discard the shared Anthropic client.
+
+    The next AI call builds a fresh client. Use this in forked worker
+    processes so they do not share the parent's connection pool.
+    """
+    global _client
+
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+
+
 def _parse_ai_response(response_text):
     """
     Parse the AI response to extract department and confidence.
@@ -174,81 +622,200 @@ def _parse_ai_response(response_text):
     department = None
     confidence = None
 
-    for line in response_text.split('\n'):
-        line = line.strip()
-
-        if line.startswith('Department:'):
-            dept = line.replace('Department:', '').strip()
-            # Match department case-insensitively
-            for valid_dept in DEPARTMENTS:
-                if valid_dept.lower() == dept.lower():
-                    department = valid_dept
-                    break
-
-        elif line.startswith('Confidence:'):
-            try:
-                confidence = int(line.replace('Confidence:', '').strip())
-                # Clamp confidence to valid range
-                confidence = max(0, min(100, confidence))
-            except ValueError:
-                logger.warning(f"Could not parse confidence value: {line}")
-                confidence = None
+    dept_match = _DEPARTMENT_LINE_RE.search(response_text)
+    if dept_match:
+        department = _match_department(dept_match.group(1))
+
+    conf_match = _CONFIDENCE_LINE_RE.search(response_text)
+    if conf_match:
+        # Clamp confidence to valid range
+        confidence = max(0, min(100, int(conf_match.group(1))))
 
     return department, confidence
 
 
-def _fallback_categorization(title, description):
+def _parse_single_response(response_text):
     """
-    Fallback categorization using simple keyword matching.
+    Parse a single-ticket AI response into a usable result.
 
-    This is used when AI service is unavailable. It's not as accurate
-    as AI but ensures the system continues to function.
+    Args:
+        response_text: Raw text response from AI
+
+    Returns:
+        tuple: (department, confidence) or None if no valid department was found
+    """
+    department, confidence = _parse_ai_response(response_text)
+
+    if department is None:
+        logger.warning("Invalid department in AI response")
+        return None
+
+    if confidence is None:
+        confidence = AI_DEFAULT_CONFIDENCE
+    return department, confidence
+
+
+def _parse_batch_response(response_text, count):
+    """
+    Parse a batch AI response with one "<number>: <department> | <confidence>"
+    line per ticket.
+
+    Args:
+        response_text: Raw text response from AI
+        count: Number of tickets in the batch
+
+    Returns:
+        dict: {ticket_number: (department, confidence)} for every valid line,
+              or None if no line could be parsed
+    """
+    results = {}
+
+    for match in _BATCH_LINE_RE.finditer(response_text):
+        number = int(match.group(1))
+        department = _match_department(match.group(2))
+        if 1 <= number <= count and department is not None:
+            confidence = max(0, min(100, int(match.group(3))))
+            results[number] = (department, confidence)
+
+    if not results:
+        logger.warning("No valid lines in batch AI response")
+        return None
+    return results
+
+
+def _match_department(name):
+    """
+    Match a department name from an AI response case-insensitively.
+
+    Args:
+        name: Department name as written by the AI
+
+    Returns:
+        str: The canonical department name, or None if it is not valid
+    """
+    return _DEPARTMENTS_BY_NAME.get(name.strip().lower())
+
+
+# Keywords used by the fallback categorization (frozen, built once at import)
+_DEPARTMENT_KEYWORDS = {
+    'IT Support': frozenset(['computer', 'laptop', 'software', 'hardware', 'network', 'internet',
+                             'email', 'password', 'login', 'system', 'application', 'printer',
+                             'wifi', 'server', 'database', 'access', 'account']),
+
+    'HR': frozenset(['payroll', 'salary', 'benefits', 'leave', 'vacation', 'sick',
+                     'employee', 'hiring', 'training', 'performance', 'hr', 'human resources']),
+
+    'Facilities': frozenset(['building', 'office', 'room', 'maintenance', 'cleaning',
+                             'parking', 'security', 'temperature', 'hvac', 'desk',
+                             'chair', 'facility', 'repair']),
+
+    'Finance': frozenset(['budget', 'expense', 'invoice', 'payment', 'reimbursement',
+                          'purchase', 'accounting', 'financial', 'cost', 'money'])
+}
+
+
+def _build_keyword_automaton():
+    """
+    Compile all department keywords into one Aho-Corasick automaton.
+
+    The automaton finds every keyword in a single pass over the text,
+    instead of one substring search per keyword.
+
+    Returns:
+        ahocorasick.Automaton: Automaton yielding (department, keyword) values
+    """
+    automaton = ahocorasick.Automaton()
+    for dept, keywords in _DEPARTMENT_KEYWORDS.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, (dept, keyword))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _keyword_scores(title, description):
+    """
+    Count the department keywords found in a ticket.
 
     Args:
         title: Ticket title
         description: Ticket description
 
     Returns:
-        tuple: (department_name, confidence_score)
+        dict: Department name -> number of distinct keywords matched
     """
-    text = (title + " " + description).lower()
+    # One pass over each field finds every keyword of every department;
+    # scanning them separately avoids copying the description into a
+    # combined string. Each keyword counts once, however often it appears.
+    matched_keywords = {value for _, value in _KEYWORD_AUTOMATON.iter(title.lower())}
+    matched_keywords.update(value for _, value in _KEYWORD_AUTOMATON.iter(description.lower()))
 
-    # Keyword-based matching
-    it_keywords = ['computer', 'laptop', 'software', 'hardware', 'network', 'internet',
-                   'email', 'password', 'login', 'system', 'application', 'printer',
-                   'wifi', 'server', 'database', 'access', 'account']
+    # Count keyword matches
+    scores = {dept: 0 for dept in DEPARTMENTS}
+    for dept, _ in matched_keywords:
+        scores[dept] += 1
+
+    return scores
 
-    hr_keywords = ['payroll', 'salary', 'benefits', 'leave', 'vacation', 'sick',
-                   'employee', 'hiring', 'training', 'performance', 'hr', 'human resources']
 
-    facilities_keywords = ['building', 'office', 'room', 'maintenance', 'cleaning',
-                          'parking', 'security', 'temperature', 'hvac', 'desk',
-                          'chair', 'facility', 'repair']
+def _keyword_shortcut(title, description):
+    """
+    Categorize a ticket from keywords alone when the answer is obvious.
 
-    finance_keywords = ['budget', 'expense', 'invoice', 'payment', 'reimbursement',
-                       'purchase', 'accounting', 'financial', 'cost', 'money']
+    A ticket qualifies when its best department has at least
+    AI_SHORTCUT_MIN_SCORE keyword matches and leads the runner-up by at
+    least AI_SHORTCUT_MIN_GAP, e.g. "Password reset" / "Can't log in to
+    my email account". The AI would not add anything for these.
 
-    # Count keyword matches
-    scores = {
-        'IT Support': sum(1 for keyword in it_keywords if keyword in text),
-        'HR': sum(1 for keyword in hr_keywords if keyword in text),
-        'Facilities': sum(1 for keyword in facilities_keywords if keyword in text),
-        'Finance': sum(1 for keyword in finance_keywords if keyword in text),
-        'General': 0
-    }
+    Args:
+        title: Ticket title
+        description: Ticket description
+
+    Returns:
+        tuple: (department_name, confidence_score), or None if the AI
+               should decide
+    """
+    scores = _keyword_scores(title, description)
+    (best_department, best_count), (_, runner_up_count) = sorted(
+        scores.items(), key=lambda item: item[1], reverse=True
+    )[:2]
+
+    if best_count >= AI_SHORTCUT_MIN_SCORE and best_count - runner_up_count >= AI_SHORTCUT_MIN_GAP:
+        return best_department, AI_SHORTCUT_CONFIDENCE
+    return None
+
+
+def _fallback_categorization(title, description):
+    """
+    Fallback categorization using simple keyword matching.
+
+    This is used when AI service is unavailable. It's not as accurate
+    as AI but ensures the system continues to function.
+
+    Args:
+        title: Ticket title
+        description: Ticket description
+
+    Returns:
+        tuple: (department_name, confidence_score)
+    """
+    scores = _keyword_scores(title, description)
 
-    # Find department with most matches
-    department = max(scores, key=scores.get)
+    # Find department with most matches (and its count) in one pass
+    best_department, best_count = max(scores.items(), key=lambda item: item[1])
 
     # If no keywords matched, use General
-    if scores[department] == 0:
+    if best_count == 0:
         department = 'General'
         confidence = AI_FALLBACK_CONFIDENCE
     else:
         # Calculate confidence based on match count
-        confidence = min(50 + (scores[department] * 10), 75)
+        department = best_department
+        confidence = min(50 + (best_count * 10), 75)
 
-    logger.info(f"Fallback categorization: {department} (confidence: {confidence}%)")
+    logger.info("Fallback categorization: %s (confidence: %s%%)", department, confidence)
     return department, confidence
 
 
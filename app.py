@@ -31,36 +31,58 @@ File Structure:
 - database.py: Database operations
 - ai_categorization.py: AI categorization logic
 - routing.py: Department routing logic
+- schemas.py: Request validation models
 - init_db.py: Database initialization
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, stream_with_context
+from flask.json.provider import JSONProvider, DefaultJSONProvider
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import ValidationError
+import hashlib
+import itertools
 import logging
+import orjson
 import os
 import sqlite3
+import threading
+import time
 
 # Import our modules
 from config import (
     DEPARTMENTS,
+    DEPARTMENTS_SET,
     TICKET_STATUSES,
+    TICKET_STATUSES_SET,
     FLASK_HOST,
     FLASK_PORT,
     FLASK_DEBUG,
     LOG_LEVEL,
-    DATABASE_NAME
+    DATABASE_NAME,
+    DATABASE_SCHEMA_VERSION,
+    AI_WORKER_THREADS,
+    AI_SYNC_CATEGORIZATION,
+    AI_RESUME_PENDING,
+    AI_RESUME_INTERVAL,
+    AI_BATCH_SIZE,
+    TICKETS_STREAM_CHUNK_SIZE
 )
 from database import (
     create_ticket,
+    create_tickets,
     get_ticket_by_id,
     update_ticket_status,
     get_tickets_by_department,
-    get_all_tickets,
+    iter_all_tickets,
     get_ticket_statistics,
+    get_tickets_version,
+    claim_uncategorized_tickets,
     ticket_exists
 )
-from ai_categorization import categorize_ticket
-from routing import route_ticket_to_department, get_routing_statistics
-from init_db import init_database
+from ai_categorization import categorize_ticket, categorize_tickets_batch
+from routing import route_ticket_to_department, create_routed_ticket, get_routing_statistics
+from init_db import init_database, release_categorization_claims
+from schemas import TicketIn, BulkTicketsIn, StatusIn, validation_error_message
 
 # Configure logging
 logging.basicConfig(
@@ -69,9 +91,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson instead of the standard json module.
+
+    Used by jsonify() for responses and by request.get_json() for request
+    bodies. Keys keep their insertion order, and types orjson does not know
+    (dates, decimals, ...) go through Flask's default conversion.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return self._dump_bytes(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # orjson produces bytes; hand them to the response as-is instead
+        # of decoding to str for dumps() and encoding again
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dump_bytes(obj), mimetype='application/json')
+
+    @staticmethod
+    def _dump_bytes(obj):
+        return orjson.dumps(
+            obj,
+            default=DefaultJSONProvider.default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+
+
 # Initialize Flask application
 app = Flask(__name__)
-app.config['JSON_SORT_KEYS'] = False
+app.json = OrjsonProvider(app)
 
 
 # ============================================================================
@@ -84,28 +137,35 @@ def ensure_database_initialized():
 
     This function checks if:
     1. The database file exists
-    2. The required 'tickets' table exists
-
-    If either check fails, it automatically initializes the database.
+    2. The schema version stored in PRAGMA user_version is current
+
+    init_database() stamps the schema version into the database header, so
+    the check is a single header read instead of a sqlite_master query.
+    If either check fails, it automatically initializes the database;
+    re-running init_database() also upgrades older schemas since every
+    statement uses IF NOT EXISTS.
+    It also switches the database to WAL journal mode.
     """
     db_needs_init = False
 
     # Check if database file exists
     if not os.path.exists(DATABASE_NAME):
-        logger.info(f"Database file '{DATABASE_NAME}' not found. Initializing database...")
+        logger.info("Database file '%s' not found. Initializing database...", DATABASE_NAME)
         db_needs_init = True
     else:
-        # Check if tickets table exists
+        # Check if the schema is up to date
         try:
             conn = sqlite3.connect(DATABASE_NAME)
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='tickets'")
-            if cursor.fetchone() is None:
-                logger.info("Database exists but 'tickets' table not found. Initializing database...")
-                db_needs_init = True
+            schema_version = conn.execute("PRAGMA user_version").fetchone()[0]
             conn.close()
+            if schema_version != DATABASE_SCHEMA_VERSION:
+                logger.info(
+                    "Database schema version is %s, expected %s. Initializing database...",
+                    schema_version, DATABASE_SCHEMA_VERSION
+                )
+                db_needs_init = True
         except Exception as e:
-            logger.warning(f"Error checking database: {e}. Initializing database...")
+            logger.warning("Error checking database: %s. Initializing database...", e)
             db_needs_init = True
 
     # Initialize database if needed
@@ -114,18 +174,194 @@ def ensure_database_initialized():
             init_database()
             logger.info("✓ Database initialized successfully!")
         except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
+            logger.error("Failed to initialize database: %s", e)
             raise
 
+    # WAL mode lets readers run alongside a writer and avoids an fsync on
+    # every commit. The mode is stored in the database file, so setting it
+    # once here applies to every later connection.
+    conn = sqlite3.connect(DATABASE_NAME)
+    journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+    conn.close()
+    logger.info("Database journal mode: %s", journal_mode)
+
 
 # Ensure database is initialized on startup
 ensure_database_initialized()
 
 
+# ============================================================================
+# BACKGROUND CATEGORIZATION
+# ============================================================================
+
+# AI categorization can take seconds (network round-trip, retries), so it
+# runs on a worker pool instead of inside the request handler
+categorization_executor = ThreadPoolExecutor(
+    max_workers=AI_WORKER_THREADS,
+    thread_name_prefix='categorization'
+)
+
+
+def _categorize_and_route(ticket_id, title, description):
+    """
+    Categorize a ticket with AI and route it to its department.
+
+    Runs on the categorization executor. Errors are logged rather than
+    raised since there is no request left to report them to.
+
+    Args:
+        ticket_id: ID of the stored ticket
+        title: Ticket title
+        description: Ticket description
+    """
+    try:
+        department, confidence_score = categorize_ticket(title, description)
+        logger.info("Ticket %s categorized as %s (%s%%)", ticket_id, department, confidence_score)
+
+        route_ticket_to_department(ticket_id, department, confidence_score)
+        logger.info("Ticket %s routed to %s", ticket_id, department)
+    except Exception as e:
+        logger.error("Error categorizing ticket %s: %s", ticket_id, e, exc_info=True)
+
+
+def _categorize_and_route_batch(ticket_ids, items):
+    """
+    Categorize several tickets with one batched AI request and route them.
+
+    Args:
+        ticket_ids: IDs of the stored tickets
+        items: (title, description) tuples in the same order as ticket_ids
+    """
+    try:
+        categorizations = categorize_tickets_batch(items)
+
+        for ticket_id, (department, confidence_score) in zip(ticket_ids, categorizations):
+            route_ticket_to_department(ticket_id, department, confidence_score)
+        logger.info("Routed %s bulk tickets", len(ticket_ids))
+    except Exception as e:
+        logger.error("Error categorizing bulk tickets %s: %s", ticket_ids, e, exc_info=True)
+
+
+def resume_pending_categorizations():
+    """
+    Re-queue tickets that are still waiting for a department.
+
+    Queued categorization work only lives in memory, so tickets queued by
+    a server process that stopped would otherwise never be routed. Only
+    tickets no running process has claimed are taken, so each one is
+    queued by exactly one process. They are submitted in batches, like
+    bulk-created tickets.
+    """
+    pending = claim_uncategorized_tickets()
+    for start in range(0, len(pending), AI_BATCH_SIZE):
+        batch = pending[start:start + AI_BATCH_SIZE]
+        categorization_executor.submit(
+            _categorize_and_route_batch,
+            [ticket_id for ticket_id, _, _ in batch],
+            [(title, description) for _, title, description in batch]
+        )
+    if pending:
+        logger.info("Re-queued %s uncategorized tickets for categorization", len(pending))
+
+
+def _run_categorization_recovery():
+    """Sweep for released uncategorized tickets until the process exits."""
+    while True:
+        try:
+            resume_pending_categorizations()
+        except Exception as e:
+            logger.error("Error re-queuing uncategorized tickets: %s", e, exc_info=True)
+        time.sleep(AI_RESUME_INTERVAL)
+
+
+def start_categorization_recovery():
+    """
+    Start re-queuing uncategorized tickets in this server process.
+
+    Called by the server entry points (the __main__ block below and
+    gunicorn_conf.py) rather than at import, so only processes that serve
+    requests pick up work. The first sweep runs right away; later sweeps
+    pick up tickets released after a worker process exits.
+    """
+    if not AI_RESUME_PENDING:
+        return
+    threading.Thread(
+        target=_run_categorization_recovery, name='categorization-recovery', daemon=True
+    ).start()
+
+
+# ============================================================================
+# CONDITIONAL RESPONSES
+# ============================================================================
+
+def _tickets_etag_response(build_response):
+    """
+    Serve a response derived from the tickets table with an ETag.
+
+    The ETag is the table's change counter, so a dashboard polling with
+    If-None-Match gets an empty 304 until a ticket is created or updated,
+    and the query and JSON encoding are skipped.
+
+    Args:
+        build_response: Function returning the full 200 response
+
+    Returns:
+        Response: 304 if the client's copy is current, otherwise the full
+                  response, both carrying the ETag
+    """
+    etag = f'tickets-{get_tickets_version()}'
+
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = build_response()
+
+    response.set_etag(etag)
+    return response
+
+
+class StaticJSONResponse:
+    """
+    JSON response for a payload that never changes while the app runs.
+
+    The payload is encoded once at import and served as raw bytes with an
+    ETag (SHA-1 of the body), so requests skip JSON encoding entirely and
+    clients that already have it get an empty 304. A public Cache-Control
+    max-age lets browsers and proxies reuse it without asking at all.
+    """
+
+    def __init__(self, payload, max_age=300):
+        self.body = orjson.dumps(payload)
+        self.etag = hashlib.sha1(self.body).hexdigest()
+        self.max_age = max_age
+
+    def response(self):
+        """
+        Build the response for the current request.
+
+        Returns:
+            Response: 304 if the client's copy is current, otherwise the
+                      full 200 response, both carrying the ETag
+        """
+        if request.if_none_match.contains(self.etag):
+            response = app.response_class(status=304)
+        else:
+            response = app.response_class(self.body, mimetype='application/json')
+
+        response.set_etag(self.etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = self.max_age
+        return response
+
+
 # ============================================================================
 # TICKET SUBMISSION ENDPOINTS
 # ============================================================================
 
+# Marks responses whose categorization is still running in the background
+_ASYNC_HEADERS = {'X-Processing': 'async'}
+
+
 @app.route('/api/tickets', methods=['POST'])
 def create_new_ticket():
     """
@@ -134,8 +370,15 @@ def create_new_ticket():
     This endpoint handles the complete ticket creation workflow:
     1. Validate input data
     2. Create ticket in database
-    3. Categorize using AI
-    4. Route to appropriate department
+    3. Categorize using AI (in the background)
+    4. Route to appropriate department (in the background)
+
+    The response is returned as soon as the ticket is stored. Clients poll
+    GET /api/tickets/<id> until the department is assigned.
+
+    With AI_SYNC_CATEGORIZATION enabled, the ticket is categorized first
+    and stored already routed, and the response (201) includes the
+    department.
 
     Request Body:
         {
@@ -146,69 +389,146 @@ def create_new_ticket():
         }
 
     Returns:
-        201: {
+        202: {
             "success": true,
             "ticket_id": 123,
-            "department": "IT Support",
-            "confidence_score": 85,
-            "message": "Ticket created successfully"
+            "department": null,
+            "confidence_score": null,
+            "status": "pending",
+            "message": "Ticket created, categorization in progress"
         }
+        201: Same fields with department and confidence_score filled in
+             (AI_SYNC_CATEGORIZATION only)
         400: Validation error
         500: Server error
     """
     try:
-        data = request.get_json()
-
-        # Validate required fields
-        required_fields = ['title', 'description', 'user_name', 'user_email']
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return jsonify({
-                    'success': False,
-                    'error': f'Missing required field: {field}'
-                }), 400
-
-        title = data['title'].strip()
-        description = data['description'].strip()
-        user_name = data['user_name'].strip()
-        user_email = data['user_email'].strip()
-
-        # Basic validation
-        if len(title) < 3:
+        try:
+            ticket = TicketIn.model_validate(request.get_json(silent=True))
+        except ValidationError as e:
             return jsonify({
                 'success': False,
-                'error': 'Title must be at least 3 characters'
+                'error': validation_error_message(e)
             }), 400
 
-        if len(description) < 10:
+        title = ticket.title
+        description = ticket.description
+        user_name = ticket.user_name
+        user_email = ticket.user_email
+
+        if AI_SYNC_CATEGORIZATION:
+            # Categorize first, then store and route with a single INSERT
+            department, confidence_score = categorize_ticket(title, description)
+            ticket_id = create_routed_ticket(
+                title, description, user_name, user_email, department, confidence_score
+            )
+            logger.info("Created ticket %s for %s in %s", ticket_id, user_name, department)
+
             return jsonify({
-                'success': False,
-                'error': 'Description must be at least 10 characters'
-            }), 400
+                'success': True,
+                'ticket_id': ticket_id,
+                'department': department,
+                'confidence_score': confidence_score,
+                'status': 'pending',
+                'message': 'Ticket created and categorized successfully'
+            }), 201
 
         # Step 1: Create ticket in database
         ticket_id = create_ticket(title, description, user_name, user_email)
-        logger.info(f"Created ticket {ticket_id} for {user_name}")
+        logger.info("Created ticket %s for %s", ticket_id, user_name)
 
-        # Step 2: AI Categorization
-        department, confidence_score = categorize_ticket(title, description)
-        logger.info(f"Ticket {ticket_id} categorized as {department} ({confidence_score}%)")
-
-        # Step 3: Route to department
-        route_ticket_to_department(ticket_id, department, confidence_score)
-        logger.info(f"Ticket {ticket_id} routed to {department}")
+        # Steps 2 and 3 (AI categorization and routing) run in the background
+        # so the response does not wait on the AI service
+        categorization_executor.submit(_categorize_and_route, ticket_id, title, description)
 
         return jsonify({
             'success': True,
             'ticket_id': ticket_id,
-            'department': department,
-            'confidence_score': confidence_score,
+            'department': None,
+            'confidence_score': None,
             'status': 'pending',
-            'message': 'Ticket created and categorized successfully'
-        }), 201
+            'message': 'Ticket created, categorization in progress'
+        }), 202, _ASYNC_HEADERS
 
     except Exception as e:
-        logger.error(f"Error creating ticket: {e}", exc_info=True)
+        logger.error("Error creating ticket: %s", e, exc_info=True)
+        return jsonify({
+            'success': False,
+            'error': 'Internal server error'
+        }), 500
+
+
+@app.route('/api/tickets/bulk', methods=['POST'])
+def create_tickets_bulk():
+    """
+    Create several support tickets in one request.
+
+    Intended for bulk ingestion (imports, email-to-ticket sync). All
+    tickets are stored in one transaction and categorized together in the
+    background with a single batched AI request instead of one request
+    per ticket.
+
+    Request Body:
+        {
+            "tickets": [
+                {
+                    "title": "Ticket title",
+                    "description": "Detailed description",
+                    "user_name": "User name",
+                    "user_email": "user@example.com"
+                },
+                ...
+            ]
+        }
+
+    Returns:
+        202: {
+            "success": true,
+            "count": 2,
+            "tickets": [
+                {"ticket_id": 123, "department": null, "confidence_score": null, "status": "pending"},
+                ...
+            ],
+            "message": "Tickets created, categorization in progress"
+        }
+        400: Validation error
+        500: Server error
+    """
+    try:
+        try:
+            tickets = BulkTicketsIn.model_validate(request.get_json(silent=True)).tickets
+        except ValidationError as e:
+            return jsonify({
+                'success': False,
+                'error': validation_error_message(e)
+            }), 400
+
+        # Step 1: Create all tickets in one transaction
+        ticket_ids = create_tickets([
+            (t.title, t.description, t.user_name, t.user_email)
+            for t in tickets
+        ])
+        logger.info("Created %s tickets in bulk", len(ticket_ids))
+
+        # Steps 2 and 3 (batched AI categorization and routing) run in the background
+        categorization_executor.submit(
+            _categorize_and_route_batch,
+            ticket_ids,
+            [(t.title, t.description) for t in tickets]
+        )
+
+        return jsonify({
+            'success': True,
+            'count': len(ticket_ids),
+            'tickets': [
+                {'ticket_id': ticket_id, 'department': None, 'confidence_score': None, 'status': 'pending'}
+                for ticket_id in ticket_ids
+            ],
+            'message': 'Tickets created, categorization in progress'
+        }), 202, _ASYNC_HEADERS
+
+    except Exception as e:
+        logger.error("Error creating tickets in bulk: %s", e, exc_info=True)
         return jsonify({
             'success': False,
             'error': 'Internal server error'
@@ -243,7 +563,7 @@ def get_ticket(ticket_id):
         }), 200
 
     except Exception as e:
-        logger.error(f"Error fetching ticket {ticket_id}: {e}")
+        logger.error("Error fetching ticket %s: %s", ticket_id, e)
         return jsonify({
             'success': False,
             'error': 'Internal server error'
@@ -255,21 +575,52 @@ def get_all_tickets_route():
     """
     Get all tickets in the system.
 
+    The ticket list is streamed: rows are encoded in chunks as they come
+    out of the database instead of building the whole list and its JSON
+    in memory first. The count is only known at the end, so it follows
+    the list in the response body.
+
+    Supports If-None-Match (see _tickets_etag_response).
+
     Returns:
         200: List of all tickets
+        304: Not modified since the client's ETag
         500: Server error
     """
     try:
-        tickets = get_all_tickets()
-
-        return jsonify({
-            'success': True,
-            'count': len(tickets),
-            'tickets': tickets
-        }), 200
+        def generate():
+            # The first chunk is only yielded once the query has run, so
+            # build_response can surface query errors before streaming
+            head = b'{"success":true,"tickets":['
+            count = 0
+            chunk = []
+            for ticket in iter_all_tickets():
+                chunk.append(orjson.dumps(ticket))
+                count += 1
+                if len(chunk) == TICKETS_STREAM_CHUNK_SIZE:
+                    yield head + b','.join(chunk)
+                    head = b','
+                    chunk = []
+            if chunk:
+                yield head + b','.join(chunk)
+            elif count == 0:
+                yield head
+            yield b'],"count":%d}' % count
+
+        def build_response():
+            # Run the query and encode the first chunk before the 200 status
+            # is sent; a database error raises here and becomes the 500 below
+            chunks = generate()
+            first = next(chunks)
+            return app.response_class(
+                stream_with_context(itertools.chain((first,), chunks)),
+                mimetype='application/json'
+            )
+
+        return _tickets_etag_response(build_response)
 
     except Exception as e:
-        logger.error(f"Error fetching all tickets: {e}")
+        logger.error("Error fetching all tickets: %s", e)
         return jsonify({
             'success': False,
             'error': 'Internal server error'
@@ -297,45 +648,35 @@ def update_status(ticket_id):
         500: Server error
     """
     try:
-        data = request.get_json()
-
-        if 'status' not in data:
+        try:
+            new_status = StatusIn.model_validate(request.get_json(silent=True)).status
+        except ValidationError as e:
             return jsonify({
                 'success': False,
-                'error': 'Missing required field: status'
+                'error': validation_error_message(e)
             }), 400
 
-        new_status = data['status']
-
-        if new_status not in TICKET_STATUSES:
+        # Update status; an UPDATE that matches no row means the ticket is
+        # missing, so existence is only checked when the update fails
+        if update_ticket_status(ticket_id, new_status):
             return jsonify({
-                'success': False,
-                'error': f'Invalid status. Must be one of: {", ".join(TICKET_STATUSES)}'
-            }), 400
+                'success': True,
+                'message': f'Ticket status updated to {new_status}'
+            }), 200
 
-        # Check if ticket exists
         if not ticket_exists(ticket_id):
             return jsonify({
                 'success': False,
                 'error': 'Ticket not found'
             }), 404
 
-        # Update status
-        success = update_ticket_status(ticket_id, new_status)
-
-        if success:
-            return jsonify({
-                'success': True,
-                'message': f'Ticket status updated to {new_status}'
-            }), 200
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'Failed to update ticket status'
-            }), 500
+        return jsonify({
+            'success': False,
+            'error': 'Failed to update ticket status'
+        }), 500
 
     except Exception as e:
-        logger.error(f"Error updating ticket {ticket_id} status: {e}")
+        logger.error("Error updating ticket %s status: %s", ticket_id, e)
         return jsonify({
             'success': False,
             'error': 'Internal server error'
@@ -361,7 +702,7 @@ def get_department_tickets_route(department):
     """
     try:
         # Validate department
-        if department not in DEPARTMENTS:
+        if department not in DEPARTMENTS_SET:
             return jsonify({
                 'success': False,
                 'error': f'Invalid department. Must be one of: {", ".join(DEPARTMENTS)}'
@@ -370,7 +711,7 @@ def get_department_tickets_route(department):
         status_filter = request.args.get('status')
 
         # Validate status filter if provided
-        if status_filter and status_filter not in TICKET_STATUSES:
+        if status_filter and status_filter not in TICKET_STATUSES_SET:
             return jsonify({
                 'success': False,
                 'error': f'Invalid status. Must be one of: {", ".join(TICKET_STATUSES)}'
@@ -388,7 +729,7 @@ def get_department_tickets_route(department):
         }), 200
 
     except Exception as e:
-        logger.error(f"Error fetching tickets for {department}: {e}")
+        logger.error("Error fetching tickets for %s: %s", department, e)
         return jsonify({
             'success': False,
             'error': 'Internal server error'
@@ -406,20 +747,26 @@ def get_dashboard_summary():
     - Distribution by status
     - Average confidence scores
 
+    Supports If-None-Match (see _tickets_etag_response).
+
     Returns:
         200: Dashboard summary data
+        304: Not modified since the client's ETag
         500: Server error
     """
     try:
-        stats = get_ticket_statistics()
+        def build_response():
+            stats = get_ticket_statistics()
 
-        return jsonify({
-            'success': True,
-            'summary': stats
-        }), 200
+            return jsonify({
+                'success': True,
+                'summary': stats
+            })
+
+        return _tickets_etag_response(build_response)
 
     except Exception as e:
-        logger.error(f"Error fetching dashboard summary: {e}")
+        logger.error("Error fetching dashboard summary: %s", e)
         return jsonify({
             'success': False,
             'error': 'Internal server error'
@@ -434,20 +781,26 @@ def get_routing_stats():
     Returns statistics about how tickets are being routed
     and the effectiveness of the AI categorization.
 
+    Supports If-None-Match (see _tickets_etag_response).
+
     Returns:
         200: Routing statistics
+        304: Not modified since the client's ETag
         500: Server error
     """
     try:
-        stats = get_routing_statistics()
+        def build_response():
+            stats = get_routing_statistics()
 
-        return jsonify({
-            'success': True,
-            'routing_stats': stats
-        }), 200
+            return jsonify({
+                'success': True,
+                'routing_stats': stats
+            })
+
+        return _tickets_etag_response(build_response)
 
     except Exception as e:
-        logger.error(f"Error fetching routing stats: {e}")
+        logger.error("Error fetching routing stats: %s", e)
         return jsonify({
             'success': False,
             'error': 'Internal server error'
@@ -458,6 +811,14 @@ def get_routing_stats():
 # SYSTEM INFORMATION ENDPOINTS
 # ============================================================================
 
+_HEALTH_RESPONSE = StaticJSONResponse({
+    'status': 'healthy',
+    'service': 'Smart Ticket System',
+    'architecture': 'monolithic',
+    'version': '1.0.0'
+}, max_age=10)  # Monitoring wants a fresh answer
+
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """
@@ -465,13 +826,15 @@ def health_check():
 
     Returns:
         200: System is healthy
+        304: Not modified since the client's ETag
     """
-    return jsonify({
-        'status': 'healthy',
-        'service': 'Smart Ticket System',
-        'architecture': 'monolithic',
-        'version': '1.0.0'
-    }), 200
+    return _HEALTH_RESPONSE.response()
+
+
+_DEPARTMENTS_RESPONSE = StaticJSONResponse({
+    'success': True,
+    'departments': DEPARTMENTS
+})
 
 
 @app.route('/api/departments', methods=['GET'])
@@ -481,11 +844,15 @@ def get_departments_list():
 
     Returns:
         200: List of departments
+        304: Not modified since the client's ETag
     """
-    return jsonify({
-        'success': True,
-        'departments': DEPARTMENTS
-    }), 200
+    return _DEPARTMENTS_RESPONSE.response()
+
+
+_STATUSES_RESPONSE = StaticJSONResponse({
+    'success': True,
+    'statuses': TICKET_STATUSES
+})
 
 
 @app.route('/api/statuses', methods=['GET'])
@@ -495,11 +862,37 @@ def get_statuses_list():
 
     Returns:
         200: List of statuses
+        304: Not modified since the client's ETag
     """
-    return jsonify({
-        'success': True,
-        'statuses': TICKET_STATUSES
-    }), 200
+    return _STATUSES_RESPONSE.response()
+
+
+_INDEX_RESPONSE = StaticJSONResponse({
+    'service': 'Smart Ticket System',
+    'architecture': 'monolithic',
+    'version': '1.0.0',
+    'endpoints': {
+        'tickets': {
+            'POST /api/tickets': 'Create a new ticket',
+            'POST /api/tickets/bulk': 'Create several tickets at once',
+            'GET /api/tickets': 'Get all tickets',
+            'GET /api/tickets/<id>': 'Get specific ticket',
+            'PUT /api/tickets/<id>/status': 'Update ticket status'
+        },
+        'departments': {
+            'GET /api/departments': 'List all departments',
+            'GET /api/departments/<dept>/tickets': 'Get tickets by department'
+        },
+        'dashboard': {
+            'GET /api/dashboard/summary': 'Get dashboard summary',
+            'GET /api/dashboard/routing': 'Get routing statistics'
+        },
+        'system': {
+            'GET /api/health': 'Health check',
+            'GET /api/statuses': 'List ticket statuses'
+        }
+    }
+})
 
 
 @app.route('/', methods=['GET'])
@@ -507,63 +900,37 @@ def index():
     """
     Root endpoint with API information.
     """
-    return jsonify({
-        'service': 'Smart Ticket System',
-        'architecture': 'monolithic',
-        'version': '1.0.0',
-        'endpoints': {
-            'tickets': {
-                'POST /api/tickets': 'Create a new ticket',
-                'GET /api/tickets': 'Get all tickets',
-                'GET /api/tickets/<id>': 'Get specific ticket',
-                'PUT /api/tickets/<id>/status': 'Update ticket status'
-            },
-            'departments': {
-                'GET /api/departments': 'List all departments',
-                'GET /api/departments/<dept>/tickets': 'Get tickets by department'
-            },
-            'dashboard': {
-                'GET /api/dashboard/summary': 'Get dashboard summary',
-                'GET /api/dashboard/routing': 'Get routing statistics'
-            },
-            'system': {
-                'GET /api/health': 'Health check',
-                'GET /api/statuses': 'List ticket statuses'
-            }
-        }
-    }), 200
+    return _INDEX_RESPONSE.response()
 
 
 # ============================================================================
 # ERROR HANDLERS
 # ============================================================================
 
+# Error bodies are constant, so they are encoded once. Each error still
+# gets a fresh Response object since responses are mutable.
+_NOT_FOUND_BODY = orjson.dumps({'success': False, 'error': 'Endpoint not found'})
+_METHOD_NOT_ALLOWED_BODY = orjson.dumps({'success': False, 'error': 'Method not allowed'})
+_INTERNAL_ERROR_BODY = orjson.dumps({'success': False, 'error': 'Internal server error'})
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({
-        'success': False,
-        'error': 'Endpoint not found'
-    }), 404
+    return app.response_class(_NOT_FOUND_BODY, status=404, mimetype='application/json')
 
 
 @app.errorhandler(405)
 def method_not_allowed(error):
     """Handle 405 errors"""
-    return jsonify({
-        'success': False,
-        'error': 'Method not allowed'
-    }), 405
+    return app.response_class(_METHOD_NOT_ALLOWED_BODY, status=405, mimetype='application/json')
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
-    logger.error(f"Internal server error: {error}")
-    return jsonify({
-        'success': False,
-        'error': 'Internal server error'
-    }), 500
+    logger.error("Internal server error: %s", error)
+    return app.response_class(_INTERNAL_ERROR_BODY, status=500, mimetype='application/json')
 
 
 # ============================================================================
@@ -574,12 +941,20 @@ if __name__ == '__main__':
     logger.info("=" * 60)
     logger.info("Smart Ticket System - Monolithic Architecture")
     logger.info("=" * 60)
-    logger.info(f"Available Departments: {', '.join(DEPARTMENTS)}")
-    logger.info(f"Ticket Statuses: {', '.join(TICKET_STATUSES)}")
+    logger.info("Available Departments: %s", ', '.join(DEPARTMENTS))
+    logger.info("Ticket Statuses: %s", ', '.join(TICKET_STATUSES))
     logger.info("")
     logger.info("Database: Auto-initialization enabled")
-    logger.info(f"Starting server on {FLASK_HOST}:{FLASK_PORT}")
+    logger.info("Starting server on %s:%s (debug: %s)", FLASK_HOST, FLASK_PORT, FLASK_DEBUG)
+    logger.info("For production use: gunicorn -c gunicorn_conf.py wsgi:app")
     logger.info("=" * 60)
 
+    # With the reloader, this block also runs in the watching parent
+    # process; only the child that serves requests categorizes tickets
+    if not FLASK_DEBUG or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        # The only server process: claims still held are from a previous run
+        release_categorization_claims()
+        start_categorization_recovery()
+
     # Run the application
     app.run(debug=FLASK_DEBUG, host=FLASK_HOST, port=FLASK_PORT)
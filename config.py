@@ -7,45 +7,89 @@ without searching through the entire codebase.
 """
 
 import os
+import sys
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file. load_dotenv() searches the
+# directory tree for the file, so it only runs on the first import (a
+# reload keeps the module globals, including _DOTENV_LOADED).
+if not globals().get('_DOTENV_LOADED'):
+    load_dotenv()
+    _DOTENV_LOADED = True
 
 # Database Configuration
 DATABASE_NAME = 'tickets.db'
+DATABASE_SCHEMA_VERSION = 4  # Bump when init_db.py changes the schema
+DATABASE_BATCH_INSERTS = False  # Group concurrent ticket inserts into one commit
+DATABASE_BATCH_MAX_SIZE = 256  # Max tickets per grouped commit
+DATABASE_POOL_SIZE = 32  # Idle connections kept open for reuse (per process)
 
 # Claude API Configuration
 CLAUDE_API_KEY = os.environ.get('CLAUDE_API_KEY', '')
 CLAUDE_MODEL = 'claude-3-5-haiku-20250929'  # Claude 3.5 Haiku model (faster and more cost-effective)
-CLAUDE_MAX_TOKENS = 300  # Max tokens for categorization response
+CLAUDE_MAX_TOKENS = 32  # Max tokens for a single-ticket response (two short lines)
+CLAUDE_TIMEOUT = 30.0  # seconds
+CLAUDE_MAX_CONNECTIONS = 200  # Size of the shared HTTP connection pool
+CLAUDE_MAX_KEEPALIVE_CONNECTIONS = 100  # Idle connections kept open for reuse
 
 # Department Configuration
-DEPARTMENTS = [
+# Names are interned so lookups of equal strings can match on identity
+DEPARTMENTS = tuple(sys.intern(name) for name in (
     'IT Support',
     'HR',
     'Facilities',
     'Finance',
     'General'
-]
+))
+DEPARTMENTS_SET = frozenset(DEPARTMENTS)  # For membership checks
 
 # Ticket Status Options
-TICKET_STATUSES = [
+TICKET_STATUSES = tuple(sys.intern(status) for status in (
     'pending',
     'in_progress',
     'resolved'
-]
+))
+TICKET_STATUSES_SET = frozenset(TICKET_STATUSES)  # For membership checks
 
 # AI Configuration
-AI_MAX_RETRIES = 3
-AI_RETRY_DELAY = 2  # seconds
+AI_MAX_RETRIES = 5
+AI_RETRY_DELAY = 2  # Base backoff in seconds for rate limits and server errors
+AI_CONNECTION_RETRY_DELAY = 1  # Base backoff in seconds for connection errors
+AI_MAX_RETRY_DELAY = 60  # Upper bound for a single backoff, in seconds
 AI_DEFAULT_CONFIDENCE = 70  # Default confidence if not provided by AI
 AI_FALLBACK_CONFIDENCE = 30  # Confidence when AI fails and we use fallback
+AI_SHORTCUT_MIN_SCORE = 3  # Keyword matches needed to skip the AI...
+AI_SHORTCUT_MIN_GAP = 2  # ...and lead over the runner-up department
+AI_SHORTCUT_CONFIDENCE = 90  # Confidence of a keyword shortcut
+AI_CACHE_SIZE = 4096  # Max categorizations kept in the in-memory LRU cache
+AI_BATCH_SIZE = 20  # Max tickets categorized in a single AI request
+AI_BATCH_TOKENS_PER_TICKET = 20  # Response token budget per ticket in a batch
+AI_WORKER_THREADS = 16  # Background threads categorizing new tickets
+AI_SYNC_CATEGORIZATION = False  # Categorize inside POST /api/tickets instead of in the background
+AI_RESUME_PENDING = True  # Re-queue tickets left uncategorized by a stopped server process
+AI_RESUME_INTERVAL = 60  # Seconds between sweeps for released uncategorized tickets
+AI_ACCOUNT_REQUESTS_PER_MINUTE = 50  # API tier request limit (whole account)
+AI_ACCOUNT_INPUT_TOKENS_PER_MINUTE = 50000  # API tier input token limit (whole account)
+# Processes sharing the account limits; gunicorn_conf.py sets it to the worker count
+AI_RATE_LIMIT_PROCESSES = max(1, int(os.environ.get('AI_RATE_LIMIT_PROCESSES', '1')))
+AI_REQUESTS_PER_MINUTE = AI_ACCOUNT_REQUESTS_PER_MINUTE / AI_RATE_LIMIT_PROCESSES  # This process's share
+AI_INPUT_TOKENS_PER_MINUTE = AI_ACCOUNT_INPUT_TOKENS_PER_MINUTE / AI_RATE_LIMIT_PROCESSES  # This process's share
+
+# Ticket Fields
+TICKET_TITLE_MAX_LENGTH = 200  # Longest accepted title, in characters
+TICKET_DESCRIPTION_MAX_LENGTH = 5000  # Longest accepted description, in characters
+
+# Bulk Ticket Creation
+BULK_MAX_TICKETS = 100  # Max tickets accepted by one bulk request
+
+# Ticket Listing
+TICKETS_STREAM_CHUNK_SIZE = 500  # Tickets per chunk when streaming GET /api/tickets
 
 # Flask Configuration
 FLASK_HOST = '0.0.0.0'
 FLASK_PORT = 5000
-FLASK_DEBUG = True
+# Debug mode (reloader + interactive debugger) is opt-in: FLASK_DEBUG=1
+FLASK_DEBUG = os.environ.get('FLASK_DEBUG', '0').lower() in ('1', 'true', 'yes')
 
 # Logging Configuration
 LOG_LEVEL = 'INFO'
@@ -11,36 +11,113 @@ This module provides a clean interface to the SQLite database,
 abstracting away the SQL details from the rest of the application.
 """
 
+import atexit
+import os
+import queue
 import sqlite3
+import threading
+import weakref
+from concurrent.futures import Future
 from contextlib import contextmanager
 import logging
-from config import DATABASE_NAME
+from config import DATABASE_NAME, DATABASE_BATCH_INSERTS, DATABASE_BATCH_MAX_SIZE, DATABASE_POOL_SIZE
 
 logger = logging.getLogger(__name__)
 
 
+class _PooledConnection(sqlite3.Connection):
+    """sqlite3 connection that can be weakly referenced (for shutdown cleanup)."""
+
+
+# Idle connections shared by every thread and greenlet of the process.
+# Most recently returned first, so the warmest page caches get reused.
+_pool = queue.LifoQueue(maxsize=DATABASE_POOL_SIZE)
+_connections = weakref.WeakSet()
+
+
+def _open_connection():
+    """
+    Open a connection for the pool and apply the per-connection settings.
+
+    The settings run once per connection, which then serves many
+    requests from the pool.
+
+    Returns:
+        sqlite3.Connection: New connection
+    """
+    # Pooled connections move between threads, but only one holder at a
+    # time uses a connection (see get_db_connection)
+    conn = sqlite3.connect(DATABASE_NAME, check_same_thread=False, factory=_PooledConnection)
+    conn.row_factory = sqlite3.Row  # Enable column access by name
+    # With WAL, NORMAL only syncs at checkpoints instead of on every commit
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA cache_size=-65536')  # 64 MB page cache
+    # Read pages straight from a memory map (up to 256 MB of the file)
+    # instead of a read() call per page. Needs a 64-bit process.
+    conn.execute('PRAGMA mmap_size=268435456')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    _connections.add(conn)
+    return conn
+
+
+@atexit.register
+def close_all_connections():
+    """Close every pooled connection that is still open."""
+    for conn in list(_connections):
+        conn.close()
+
+
+def _release_connection(conn):
+    """Return a connection to the pool, or close it if the pool is full."""
+    try:
+        _pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+
 @contextmanager
 def get_db_connection():
     """
     Context manager for database connections.
-    Ensures connections are properly closed even if errors occur.
+    Commits on success and rolls back if errors occur.
+
+    Connections come from a process-wide pool and go back to it afterwards,
+    so queries don't pay for opening the database file and warming the page
+    cache every time, whichever thread or greenlet runs them. The pool
+    never blocks: when every pooled connection is in use a new one is
+    opened, and at most DATABASE_POOL_SIZE idle connections are kept.
 
     Usage:
         with get_db_connection() as conn:
             cursor = conn.cursor()
             # ... perform database operations
     """
-    conn = sqlite3.connect(DATABASE_NAME)
-    conn.row_factory = sqlite3.Row  # Enable column access by name
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = _open_connection()
+
     try:
         yield conn
         conn.commit()
     except Exception as e:
         conn.rollback()
-        logger.error(f"Database error: {e}")
+        logger.error("Database error: %s", e)
+        raise
+    except BaseException:
+        # e.g. GeneratorExit from a streaming generator closed early
+        conn.rollback()
         raise
     finally:
-        conn.close()
+        _release_connection(conn)
+
+
+# New tickets are claimed by the inserting process, which queues them for
+# categorization; see claim_uncategorized_tickets()
+_INSERT_TICKET_SQL = '''
+    INSERT INTO tickets (title, description, user_name, user_email, status, claimed_by)
+    VALUES (?, ?, ?, ?, 'pending', ?)
+'''
 
 
 def create_ticket(title, description, user_name, user_email):
@@ -53,20 +130,139 @@ def create_ticket(title, description, user_name, user_email):
         user_name: Name of the user submitting the ticket
         user_email: Email of the user
 
+    Returns:
+        int: ID of the newly created ticket
+    """
+    if DATABASE_BATCH_INSERTS:
+        ticket_id = _queue_ticket_insert((title, description, user_name, user_email))
+        logger.info("Created ticket %s for user %s", ticket_id, user_name)
+        return ticket_id
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(_INSERT_TICKET_SQL, (title, description, user_name, user_email, os.getpid()))
+        ticket_id = cursor.lastrowid
+        logger.info("Created ticket %s for user %s", ticket_id, user_name)
+        return ticket_id
+
+
+# Tickets waiting for the insert worker, as ((title, ...), Future) pairs
+_insert_queue = queue.Queue()
+_insert_worker_lock = threading.Lock()
+_insert_worker = None
+
+
+def _queue_ticket_insert(row):
+    """
+    Hand a ticket to the insert worker and wait for its ID.
+
+    Concurrent callers are committed together in one transaction, so a
+    burst of ticket submissions pays for one commit instead of one each.
+
+    Args:
+        row: (title, description, user_name, user_email) tuple
+
+    Returns:
+        int: ID of the newly created ticket
+    """
+    global _insert_worker
+
+    # Started on first use, so each gunicorn worker process gets its own
+    if _insert_worker is None:
+        with _insert_worker_lock:
+            if _insert_worker is None:
+                _insert_worker = threading.Thread(
+                    target=_run_insert_worker, name='ticket-inserts', daemon=True
+                )
+                _insert_worker.start()
+
+    future = Future()
+    _insert_queue.put((row, future))
+    return future.result()
+
+
+def _run_insert_worker():
+    """
+    Insert queued tickets in batches until the process exits.
+
+    Waits for one ticket, then takes whatever else queued up meanwhile
+    (up to DATABASE_BATCH_MAX_SIZE). Under load, tickets accumulate while
+    the previous batch commits, so batching needs no fixed delay.
+    """
+    while True:
+        batch = [_insert_queue.get()]
+        while len(batch) < DATABASE_BATCH_MAX_SIZE:
+            try:
+                batch.append(_insert_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                ticket_ids = []
+                for row, _ in batch:
+                    cursor.execute(_INSERT_TICKET_SQL, (*row, os.getpid()))
+                    ticket_ids.append(cursor.lastrowid)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            continue
+
+        for (_, future), ticket_id in zip(batch, ticket_ids):
+            future.set_result(ticket_id)
+
+
+def create_ticket_with_routing(title, description, user_name, user_email, department, confidence_score):
+    """
+    Create a ticket that has already been categorized.
+
+    Stores the department and confidence with the INSERT itself, instead
+    of a create_ticket() followed by update_ticket_department().
+
+    Args:
+        title: Ticket title
+        description: Ticket description
+        user_name: Name of the user submitting the ticket
+        user_email: Email of the user
+        department: Department name
+        confidence_score: AI confidence score (0-100)
+
     Returns:
         int: ID of the newly created ticket
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
-            INSERT INTO tickets (title, description, user_name, user_email, status)
-            VALUES (?, ?, ?, ?, 'pending')
-        ''', (title, description, user_name, user_email))
+            INSERT INTO tickets (title, description, user_name, user_email, status, department, confidence_score)
+            VALUES (?, ?, ?, ?, 'pending', ?, ?)
+        ''', (title, description, user_name, user_email, department, confidence_score))
         ticket_id = cursor.lastrowid
-        logger.info(f"Created ticket {ticket_id} for user {user_name}")
+        logger.info("Created ticket %s for user %s in %s", ticket_id, user_name, department)
         return ticket_id
 
 
+def create_tickets(tickets):
+    """
+    Create several tickets in a single transaction.
+
+    Args:
+        tickets: List of (title, description, user_name, user_email) tuples
+
+    Returns:
+        list: IDs of the newly created tickets, in the same order
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        ticket_ids = []
+        pid = os.getpid()
+        for ticket in tickets:
+            cursor.execute(_INSERT_TICKET_SQL, (*ticket, pid))
+            ticket_ids.append(cursor.lastrowid)
+        logger.info("Created %s tickets in bulk", len(ticket_ids))
+        return ticket_ids
+
+
 def get_ticket_by_id(ticket_id):
     """
     Retrieve a ticket by its ID.
@@ -104,10 +300,10 @@ def update_ticket_department(ticket_id, department, confidence_score):
                 SET department = ?, confidence_score = ?, updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
             ''', (department, confidence_score, ticket_id))
-            logger.info(f"Updated ticket {ticket_id} department to {department}")
+            logger.info("Updated ticket %s department to %s", ticket_id, department)
             return True
     except Exception as e:
-        logger.error(f"Error updating ticket {ticket_id} department: {e}")
+        logger.error("Error updating ticket %s department: %s", ticket_id, e)
         return False
 
 
@@ -120,7 +316,8 @@ def update_ticket_status(ticket_id, status):
         status: New status (pending, in_progress, resolved)
 
     Returns:
-        bool: True if successful, False otherwise
+        bool: True if the ticket was updated, False if it does not exist
+              or the update failed
     """
     try:
         with get_db_connection() as conn:
@@ -130,13 +327,33 @@ def update_ticket_status(ticket_id, status):
                 SET status = ?, updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
             ''', (status, ticket_id))
-            logger.info(f"Updated ticket {ticket_id} status to {status}")
+            if cursor.rowcount == 0:
+                return False
+            logger.info("Updated ticket %s status to %s", ticket_id, status)
             return True
     except Exception as e:
-        logger.error(f"Error updating ticket {ticket_id} status: {e}")
+        logger.error("Error updating ticket %s status: %s", ticket_id, e)
         return False
 
 
+def _rows_to_dicts(cursor):
+    """
+    Convert the rows of an executed query into dictionaries.
+
+    The cursor should return plain tuples (row_factory = None): zipping
+    them with the column names once is cheaper than building sqlite3.Row
+    objects and converting each of them with dict().
+
+    Args:
+        cursor: Cursor with an executed SELECT
+
+    Returns:
+        list: One dict per row, keyed by column name
+    """
+    columns = [description[0] for description in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+
 def get_tickets_by_department(department, status_filter=None):
     """
     Get all tickets for a specific department.
@@ -150,6 +367,7 @@ def get_tickets_by_department(department, status_filter=None):
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
+        cursor.row_factory = None  # Plain tuples, see _rows_to_dicts
 
         if status_filter:
             cursor.execute('''
@@ -164,8 +382,7 @@ def get_tickets_by_department(department, status_filter=None):
                 ORDER BY created_at DESC
             ''', (department,))
 
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _rows_to_dicts(cursor)
 
 
 def get_all_tickets():
@@ -177,45 +394,102 @@ def get_all_tickets():
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
+        cursor.row_factory = None  # Plain tuples, see _rows_to_dicts
         cursor.execute('SELECT * FROM tickets ORDER BY created_at DESC')
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _rows_to_dicts(cursor)
+
+
+def iter_all_tickets():
+    """
+    Iterate over all tickets without loading them into a list.
+
+    Rows are converted one at a time while the query runs, so memory use
+    does not grow with the size of the table.
+
+    Yields:
+        dict: Ticket dictionaries, newest first
+    """
+    # The connection stays checked out until the generator is exhausted
+    # or closed; the cursor is closed first so the read ends before the
+    # connection goes back to the pool
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.row_factory = None  # Plain tuples, see _rows_to_dicts
+            cursor.execute('SELECT * FROM tickets ORDER BY created_at DESC')
+            columns = [description[0] for description in cursor.description]
+            for row in cursor:
+                yield dict(zip(columns, row))
+        finally:
+            cursor.close()
+
+
+# (tickets_version, statistics) of the last get_ticket_statistics() call
+_statistics_cache = (None, None)
 
 
 def get_ticket_statistics():
     """
     Get summary statistics for all tickets.
 
+    The result is memoized against the tickets_version counter, so the
+    dashboards only re-run the aggregate query after tickets change.
+    Callers share the returned dict and must not modify it.
+
     Returns:
         dict: Statistics including total count, by department, by status, etc.
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
+    global _statistics_cache
 
-        # Total tickets
-        cursor.execute('SELECT COUNT(*) as count FROM tickets')
-        total_tickets = cursor.fetchone()['count']
+    # Read the version first: stats computed afterwards are at least as
+    # new, so a concurrent write can only cause an extra recomputation
+    version = get_tickets_version()
+    cached_version, cached_stats = _statistics_cache
+    if cached_version == version:
+        return cached_stats
 
-        # By department (exclude NULL departments)
-        cursor.execute('''
-            SELECT department, COUNT(*) as count
-            FROM tickets
-            WHERE department IS NOT NULL
-            GROUP BY department
-        ''')
-        by_department = {row['department']: row['count'] for row in cursor.fetchall()}
+    stats = _compute_ticket_statistics()
+    _statistics_cache = (version, stats)
+    return stats
+
+
+def _compute_ticket_statistics():
+    """
+    Run the aggregate query behind get_ticket_statistics().
 
-        # By status
+    Returns:
+        dict: Statistics including total count, by department, by status, etc.
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+
+        # One scan groups by both columns; the totals are summed up below
         cursor.execute('''
-            SELECT status, COUNT(*) as count
+            SELECT department, status, COUNT(*) as count,
+                   SUM(confidence_score) as confidence_sum,
+                   COUNT(confidence_score) as confidence_count
             FROM tickets
-            GROUP BY status
+            GROUP BY department, status
         ''')
-        by_status = {row['status']: row['count'] for row in cursor.fetchall()}
 
-        # Average confidence score (exclude NULL values)
-        cursor.execute('SELECT AVG(confidence_score) as avg_confidence FROM tickets WHERE confidence_score IS NOT NULL')
-        avg_confidence = cursor.fetchone()['avg_confidence'] or 0
+        total_tickets = 0
+        by_department = {}
+        by_status = {}
+        confidence_sum = 0
+        confidence_count = 0
+
+        for row in cursor.fetchall():
+            count = row['count']
+            total_tickets += count
+            # Exclude NULL departments (tickets still being categorized)
+            if row['department'] is not None:
+                by_department[row['department']] = by_department.get(row['department'], 0) + count
+            by_status[row['status']] = by_status.get(row['status'], 0) + count
+            # Average confidence score (exclude NULL values)
+            confidence_sum += row['confidence_sum'] or 0
+            confidence_count += row['confidence_count']
+
+        avg_confidence = confidence_sum / confidence_count if confidence_count else 0
 
         return {
             'total_tickets': total_tickets,
@@ -225,6 +499,27 @@ def get_ticket_statistics():
         }
 
 
+def claim_uncategorized_tickets():
+    """
+    Claim the uncategorized tickets no server process is working on.
+
+    Claiming and reading happen in one UPDATE ... RETURNING statement, so
+    when several processes sweep at once each ticket goes to exactly one.
+
+    Returns:
+        list: (id, title, description) tuples of the claimed tickets, oldest first
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None  # Plain tuples
+        cursor.execute('''
+            UPDATE tickets SET claimed_by = ?
+            WHERE department IS NULL AND claimed_by IS NULL
+            RETURNING id, title, description
+        ''', (os.getpid(),))
+        return sorted(cursor.fetchall())
+
+
 def ticket_exists(ticket_id):
     """
     Check if a ticket exists in the database.
@@ -237,5 +532,59 @@ def ticket_exists(ticket_id):
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute('SELECT id FROM tickets WHERE id = ?', (ticket_id,))
+        cursor.row_factory = None  # Only the presence of a row matters
+        cursor.execute('SELECT 1 FROM tickets WHERE id = ? LIMIT 1', (ticket_id,))
         return cursor.fetchone() is not None
+
+
+def get_tickets_version():
+    """
+    Get the change counter of the tickets table.
+
+    The counter is bumped by triggers on every insert, update and delete,
+    so an unchanged value means every ticket query returns the same data.
+
+    Returns:
+        int: Current version
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT version FROM tickets_version WHERE id = 1')
+        return cursor.fetchone()['version']
+
+
+def get_cached_categorization(cache_key):
+    """
+    Look up a previously stored AI categorization.
+
+    Args:
+        cache_key: Hash of the ticket title and description
+
+    Returns:
+        tuple: (department, confidence) or None if not cached
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT department, confidence FROM ticket_cache WHERE hash = ?',
+            (cache_key,)
+        )
+        row = cursor.fetchone()
+        return (row['department'], row['confidence']) if row else None
+
+
+def save_cached_categorization(cache_key, department, confidence):
+    """
+    Store an AI categorization so identical tickets can skip the AI call.
+
+    Args:
+        cache_key: Hash of the ticket title and description
+        department: Department name
+        confidence: AI confidence score (0-100)
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO ticket_cache (hash, department, confidence)
+            VALUES (?, ?, ?)
+        ''', (cache_key, department, confidence))
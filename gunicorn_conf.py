@@ -0,0 +1,81 @@
+"""
+Gunicorn Configuration for Smart Ticket System
+
+Runs the application under gunicorn with gevent workers. Ticket handling
+mostly waits on network I/O (Claude API calls), so each worker serves many
+requests concurrently on green threads instead of one request at a time.
+
+Usage:
+    gunicorn -c gunicorn_conf.py wsgi:app
+
+Environment variables:
+    GUNICORN_WORKERS: Number of worker processes (default: CPU count)
+"""
+
+import os
+import sys
+
+workers = int(os.environ.get("GUNICORN_WORKERS", os.cpu_count() or 1))
+
+# The AI rate governor runs in every worker; split the account's limits
+# between them. Set before config is imported here, since the workers
+# inherit this process's modules and environment when they fork.
+os.environ["AI_RATE_LIMIT_PROCESSES"] = str(workers)
+
+from config import FLASK_HOST, FLASK_PORT
+
+bind = f"{FLASK_HOST}:{FLASK_PORT}"
+
+worker_class = "gevent"
+worker_connections = 200  # Concurrent requests per worker
+timeout = 60
+
+# Each worker imports the app itself, after gevent has patched the
+# standard library. Preloading in the master would import ssl/httpx
+# before the patch is applied.
+preload_app = False
+
+accesslog = "-"
+errorlog = "-"
+
+
+def on_starting(server):
+    """
+    Release the tickets claimed by the previous server's workers, so the
+    new workers re-queue them. Runs in the master before any worker starts.
+    """
+    from init_db import release_categorization_claims
+    release_categorization_claims()
+
+
+def post_fork(server, worker):
+    """
+    Per-worker setup. Makes sure a worker never reuses the parent's Claude
+    client.
+
+    The client is created lazily, so it normally does not exist yet when a
+    worker forks. If the app was loaded before forking, drop the inherited
+    client so the worker builds its own connection pool.
+    """
+    ai_categorization = sys.modules.get("ai_categorization")
+    if ai_categorization is not None:
+        ai_categorization.reset_client()
+
+
+def post_worker_init(worker):
+    """
+    Start re-queuing uncategorized tickets once the worker has loaded the
+    app. Every worker sweeps; a ticket is claimed by exactly one of them.
+    """
+    sys.modules["app"].start_categorization_recovery()
+
+
+def child_exit(server, worker):
+    """
+    Release the tickets a worker had queued when it exits (crash, timeout
+    or HUP), so a surviving worker's next sweep re-queues them.
+    """
+    from init_db import release_categorization_claims
+    released = release_categorization_claims(worker.pid)
+    if released:
+        server.log.info("Released %s uncategorized tickets of worker %s", released, worker.pid)
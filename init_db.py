@@ -5,9 +5,10 @@ This script creates the SQLite database and the necessary tables.
 Run this once before starting the application.
 """
 
+import os
 import sqlite3
 from datetime import datetime
-from config import DATABASE_NAME
+from config import DATABASE_NAME, DATABASE_SCHEMA_VERSION
 
 def init_database():
     """
@@ -19,6 +20,10 @@ def init_database():
     conn = sqlite3.connect(DATABASE_NAME)
     cursor = conn.cursor()
 
+    # Larger pages mean fewer page reads when scanning the tickets table.
+    # Only takes effect when the database file is first created.
+    cursor.execute('PRAGMA page_size=8192')
+
     # Create tickets table
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS tickets (
@@ -31,15 +36,25 @@ def init_database():
             confidence_score INTEGER,
             status TEXT DEFAULT 'pending',
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            claimed_by INTEGER
         )
     ''')
 
-    # Create index on department for faster queries
+    # claimed_by is the pid of the server process whose categorization queue
+    # holds an uncategorized ticket. Added to tables from older schemas.
+    columns = {row[1] for row in cursor.execute('PRAGMA table_info(tickets)')}
+    if 'claimed_by' not in columns:
+        cursor.execute('ALTER TABLE tickets ADD COLUMN claimed_by INTEGER')
+
+    # Department listings filter by department and status and sort newest
+    # first; this index answers them without a sort step. Its department
+    # prefix also serves department-only lookups, replacing idx_department.
     cursor.execute('''
-        CREATE INDEX IF NOT EXISTS idx_department
-        ON tickets(department)
+        CREATE INDEX IF NOT EXISTS idx_dept_status_created
+        ON tickets(department, status, created_at DESC)
     ''')
+    cursor.execute('DROP INDEX IF EXISTS idx_department')
 
     # Create index on status for faster queries
     cursor.execute('''
@@ -47,12 +62,82 @@ def init_database():
         ON tickets(status)
     ''')
 
+    # Create categorization cache table (keyed by hash of title + description)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ticket_cache (
+            hash BLOB PRIMARY KEY,
+            department TEXT NOT NULL,
+            confidence INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Single-row counter bumped by triggers on every change to tickets.
+    # Read endpoints use it as a cheap ETag for "has anything changed?"
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS tickets_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )
+    ''')
+    cursor.execute('INSERT OR IGNORE INTO tickets_version (id, version) VALUES (1, 0)')
+
+    for event in ('INSERT', 'UPDATE', 'DELETE'):
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS tickets_version_{event.lower()}
+            AFTER {event} ON tickets
+            BEGIN
+                UPDATE tickets_version SET version = version + 1 WHERE id = 1;
+            END
+        ''')
+
+    # Record the schema version so startup can skip re-checking the tables
+    cursor.execute(f'PRAGMA user_version = {DATABASE_SCHEMA_VERSION}')
+
     conn.commit()
     conn.close()
 
     print("✓ Database initialized successfully!")
     print("✓ Created 'tickets' table with proper indexes")
+    print("✓ Created 'ticket_cache' table for AI categorization results")
+    print("✓ Created 'tickets_version' change counter")
     print(f"✓ Database file: {DATABASE_NAME}")
 
+def release_categorization_claims(pid=None):
+    """
+    Release uncategorized tickets claimed by server processes that are gone,
+    so the next recovery sweep re-queues them.
+
+    Uses its own connection rather than the database module's pool, since
+    the gunicorn master calls it and must not open pooled connections that
+    its workers would inherit.
+
+    Args:
+        pid: Process whose claims to release (default: every process)
+
+    Returns:
+        int: Number of tickets released
+    """
+    if not os.path.exists(DATABASE_NAME):
+        return 0
+
+    conn = sqlite3.connect(DATABASE_NAME)
+    try:
+        if pid is None:
+            cursor = conn.execute(
+                'UPDATE tickets SET claimed_by = NULL WHERE department IS NULL AND claimed_by IS NOT NULL'
+            )
+        else:
+            cursor = conn.execute(
+                'UPDATE tickets SET claimed_by = NULL WHERE department IS NULL AND claimed_by = ?', (pid,)
+            )
+        conn.commit()
+        return cursor.rowcount
+    except sqlite3.OperationalError:
+        # Schema from before claims existed (or no tables yet): nothing to release
+        return 0
+    finally:
+        conn.close()
+
 if __name__ == '__main__':
     init_database()
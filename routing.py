@@ -14,8 +14,8 @@ would involve:
 """
 
 import logging
-from database import update_ticket_department
-from config import DEPARTMENTS
+from database import update_ticket_department, create_ticket_with_routing
+from config import DEPARTMENTS, DEPARTMENTS_SET
 
 logger = logging.getLogger(__name__)
 
@@ -38,27 +38,67 @@ def route_ticket_to_department(ticket_id, department, confidence_score):
     Raises:
         ValueError: If department is invalid
     """
-    # Validate department
-    if department not in DEPARTMENTS:
-        logger.error(f"Invalid department: {department}")
-        raise ValueError(f"Invalid department. Must be one of: {', '.join(DEPARTMENTS)}")
-
-    # Validate confidence score
-    if not isinstance(confidence_score, (int, float)) or confidence_score < 0 or confidence_score > 100:
-        logger.error(f"Invalid confidence score: {confidence_score}")
-        raise ValueError("Confidence score must be between 0 and 100")
+    _validate_routing(department, confidence_score)
 
     # Update the ticket in the database
     success = update_ticket_department(ticket_id, department, confidence_score)
 
     if success:
-        logger.info(f"Successfully routed ticket {ticket_id} to {department} department")
+        logger.info("Successfully routed ticket %s to %s department", ticket_id, department)
         return True
     else:
-        logger.error(f"Failed to route ticket {ticket_id} to {department}")
+        logger.error("Failed to route ticket %s to %s", ticket_id, department)
         return False
 
 
+def create_routed_ticket(title, description, user_name, user_email, department, confidence_score):
+    """
+    Create a ticket directly in its department queue.
+
+    Used when categorization finishes before the ticket is stored, so
+    creating and routing take a single INSERT.
+
+    Args:
+        title: Ticket title
+        description: Ticket description
+        user_name: Name of the user submitting the ticket
+        user_email: Email of the user
+        department: Department name (must be valid)
+        confidence_score: AI confidence score (0-100)
+
+    Returns:
+        int: ID of the newly created ticket
+
+    Raises:
+        ValueError: If department or confidence score is invalid
+    """
+    _validate_routing(department, confidence_score)
+
+    ticket_id = create_ticket_with_routing(
+        title, description, user_name, user_email, department, confidence_score
+    )
+    logger.info("Successfully routed ticket %s to %s department", ticket_id, department)
+    return ticket_id
+
+
+def _validate_routing(department, confidence_score):
+    """
+    Check a categorization result before it is stored.
+
+    Raises:
+        ValueError: If department or confidence score is invalid
+    """
+    # Validate department
+    if department not in DEPARTMENTS_SET:
+        logger.error("Invalid department: %s", department)
+        raise ValueError(f"Invalid department. Must be one of: {', '.join(DEPARTMENTS)}")
+
+    # Validate confidence score
+    if not isinstance(confidence_score, (int, float)) or confidence_score < 0 or confidence_score > 100:
+        logger.error("Invalid confidence score: %s", confidence_score)
+        raise ValueError("Confidence score must be between 0 and 100")
+
+
 def reroute_ticket(ticket_id, new_department, confidence_score):
     """
     Reroute a ticket to a different department.
@@ -76,7 +116,7 @@ def reroute_ticket(ticket_id, new_department, confidence_score):
     Returns:
         bool: True if rerouting was successful, False otherwise
     """
-    logger.info(f"Rerouting ticket {ticket_id} to {new_department}")
+    logger.info("Rerouting ticket %s to %s", ticket_id, new_department)
     return route_ticket_to_department(ticket_id, new_department, confidence_score)
 
 
@@ -119,6 +159,18 @@ def validate_routing_rules():
     Validate that routing configuration is correct.
 
     This is useful for system health checks and startup validation.
+    The departments are fixed at import, so the check runs once and each
+    call returns a copy of that result.
+
+    Returns:
+        dict: Validation results
+    """
+    return {**_VALIDATION_RESULT, 'issues': list(_VALIDATION_RESULT['issues'])}
+
+
+def _compute_validation():
+    """
+    Run the routing configuration checks behind validate_routing_rules().
 
     Returns:
         dict: Validation results
@@ -130,7 +182,7 @@ def validate_routing_rules():
         issues.append("No departments defined")
 
     # Check for duplicate departments
-    if len(DEPARTMENTS) != len(set(DEPARTMENTS)):
+    if len(DEPARTMENTS) != len(DEPARTMENTS_SET):
         issues.append("Duplicate departments found")
 
     # Check that all departments have valid names
@@ -146,3 +198,6 @@ def validate_routing_rules():
         'departments': DEPARTMENTS,
         'issues': issues
     }
+
+
+_VALIDATION_RESULT = _compute_validation()
@@ -0,0 +1,94 @@
+"""
+Request Schemas for Smart Ticket System
+
+Defines the JSON bodies accepted by the API as Pydantic models.
+
+The models are built once at import, so validating a request is a single
+call into Pydantic's compiled validator instead of a chain of per-field
+checks repeated in every route. Error messages are translated back into
+the same wording the API has always returned.
+"""
+
+from typing import Annotated, List, Literal
+from pydantic import BaseModel, Field, StringConstraints
+from config import (
+    TICKET_STATUSES, BULK_MAX_TICKETS,
+    TICKET_TITLE_MAX_LENGTH, TICKET_DESCRIPTION_MAX_LENGTH
+)
+
+
+def _text(min_length, max_length=None):
+    """String field that is stripped before its length is checked."""
+    return Annotated[str, StringConstraints(strip_whitespace=True, min_length=min_length, max_length=max_length)]
+
+
+class TicketIn(BaseModel):
+    """Body of POST /api/tickets (and each entry of a bulk request)."""
+
+    title: _text(3, TICKET_TITLE_MAX_LENGTH)
+    description: _text(10, TICKET_DESCRIPTION_MAX_LENGTH)
+    user_name: _text(1)
+    user_email: _text(1)
+
+
+class BulkTicketsIn(BaseModel):
+    """Body of POST /api/tickets/bulk."""
+
+    tickets: Annotated[List[TicketIn], Field(min_length=1, max_length=BULK_MAX_TICKETS)]
+
+
+class StatusIn(BaseModel):
+    """Body of PUT /api/tickets/<id>/status."""
+
+    status: Literal[TICKET_STATUSES]
+
+
+def validation_error_message(error):
+    """
+    Turn the first error of a ValidationError into an API error message.
+
+    Args:
+        error: ValidationError raised by one of the models above
+
+    Returns:
+        str: Human readable error message
+    """
+    detail = error.errors()[0]
+    location = detail['loc']
+    error_type = detail['type']
+
+    # Errors inside a bulk request are prefixed with the ticket's position
+    # in the list, counting from 1
+    prefix = ''
+    if len(location) >= 2 and location[0] == 'tickets' and isinstance(location[1], int):
+        prefix = f'Ticket {location[1] + 1}: '
+        location = location[2:]
+
+    if not location:
+        return f'{prefix}Ticket must be a JSON object' if prefix else 'Request body must be a JSON object'
+
+    field = location[0]
+
+    if field == 'tickets':
+        if error_type == 'too_long':
+            return f'Too many tickets. Maximum per request is {BULK_MAX_TICKETS}'
+        return 'Request body must contain a non-empty "tickets" list'
+
+    if field == 'status' and error_type == 'literal_error':
+        return f'Invalid status. Must be one of: {", ".join(TICKET_STATUSES)}'
+
+    # Absent, null and blank values are all reported as missing
+    value = detail.get('input')
+    if error_type == 'missing' or value is None or (isinstance(value, str) and not value.strip()):
+        return f'{prefix}Missing required field: {field}'
+
+    if error_type == 'string_too_short':
+        label = field.replace('_', ' ').capitalize()
+        return f'{prefix}{label} must be at least {detail["ctx"]["min_length"]} characters'
+
+    if error_type == 'string_too_long':
+        label = field.replace('_', ' ').capitalize()
+        return f'{prefix}{label} must be at most {detail["ctx"]["max_length"]} characters'
+
+    return f'{prefix}Invalid value for {field}: {detail["msg"]}'
+
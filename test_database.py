@@ -0,0 +1,160 @@
+"""
+Database Test Script for Smart Ticket System
+
+Checks that database connections are pooled per process, so requests
+reuse open connections whichever thread or greenlet serves them. Runs
+under gevent like the gunicorn workers, against a throwaway database;
+the server does not need to be running.
+
+Usage:
+    python test_database.py
+"""
+
+from gevent import monkey
+monkey.patch_all()
+
+import os
+import queue
+import sys
+import tempfile
+import threading
+
+import gevent
+
+# Import the app's modules from this directory, but work on a temporary database
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.chdir(tempfile.mkdtemp())
+
+import database
+from init_db import init_database
+
+# Test results tracking
+test_results = {"passed": 0, "failed": 0}
+
+
+def reset_pool():
+    """Close and drop every idle pooled connection"""
+    while True:
+        try:
+            database._pool.get_nowait().close()
+        except queue.Empty:
+            return
+
+
+def count_opens(fn):
+    """Run fn on an empty pool and return how many connections it opened"""
+    reset_pool()
+    opened = []
+    open_connection = database._open_connection
+
+    def counting_open():
+        opened.append(1)
+        return open_connection()
+
+    database._open_connection = counting_open
+    try:
+        fn()
+    finally:
+        database._open_connection = open_connection
+    return len(opened)
+
+
+def check(test_name, passed, detail):
+    """Print and record the outcome of a test"""
+    if passed:
+        test_results["passed"] += 1
+        print(f"✓ {test_name}")
+    else:
+        test_results["failed"] += 1
+        print(f"✗ {test_name}: {detail}")
+
+
+def test_greenlets_share_connections():
+    """One greenlet per request, as under the gevent workers"""
+    def run():
+        gevent.joinall([gevent.spawn(database.get_ticket_by_id, 1) for _ in range(50)])
+
+    opens = count_opens(run)
+    check("50 greenlets reuse one connection", opens == 1, f"{opens} connections opened")
+
+
+def test_concurrent_greenlets_reuse_pool():
+    """Overlapping requests in waves: each wave reuses the last wave's connections"""
+    def hold_connection():
+        with database.get_db_connection() as conn:
+            conn.execute('SELECT COUNT(*) FROM tickets').fetchone()
+            gevent.sleep(0.01)  # Yield while holding the connection
+
+    def run():
+        for _ in range(5):
+            gevent.joinall([gevent.spawn(hold_connection) for _ in range(20)])
+
+    opens = count_opens(run)
+    check("5 waves of 20 concurrent greenlets open 20 connections", opens == 20, f"{opens} connections opened")
+
+
+def test_threads_share_connections():
+    """One short-lived thread per request, as under the Werkzeug dev server"""
+    def run():
+        for _ in range(20):
+            thread = threading.Thread(target=database.get_ticket_by_id, args=(1,))
+            thread.start()
+            thread.join()
+
+    opens = count_opens(run)
+    check("20 request threads reuse one connection", opens == 1, f"{opens} connections opened")
+
+
+def test_settings_applied_once():
+    """The PRAGMAs run when a connection is opened, not on every request"""
+    settings = []
+
+    def run():
+        for _ in range(100):
+            database.get_ticket_by_id(1)
+        with database.get_db_connection() as conn:
+            settings.append(conn.execute('PRAGMA cache_size').fetchone()[0])
+            settings.append(conn.execute('PRAGMA synchronous').fetchone()[0])
+
+    opens = count_opens(run)
+    check(
+        "101 requests configure one connection that keeps its settings",
+        opens == 1 and settings == [-65536, 1],
+        f"{opens} connections opened, cache_size/synchronous = {settings}"
+    )
+
+
+def test_closed_stream_returns_connection():
+    """A ticket stream closed early hands its connection back to the pool"""
+    def run():
+        tickets = database.iter_all_tickets()
+        next(tickets)
+        tickets.close()
+        database.get_ticket_by_id(1)
+
+    opens = count_opens(run)
+    check("Closed ticket stream releases its connection", opens == 1, f"{opens} connections opened")
+
+
+def main():
+    """Main test execution"""
+    init_database()
+    database.create_tickets([
+        ("Laptop not working", "My laptop will not turn on at all", "John Doe", "john@example.com"),
+        ("Payroll question", "My paycheck is missing overtime hours", "Jane Smith", "jane@example.com"),
+    ])
+
+    print()
+    test_greenlets_share_connections()
+    test_concurrent_greenlets_reuse_pool()
+    test_threads_share_connections()
+    test_settings_applied_once()
+    test_closed_stream_returns_connection()
+
+    print(f"\nPassed: {test_results['passed']}")
+    print(f"Failed: {test_results['failed']}")
+    return 0 if test_results["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+"""
+WSGI Entry Point for Smart Ticket System
+
+Exposes the Flask application for production WSGI servers.
+
+Usage:
+    gunicorn -c gunicorn_conf.py wsgi:app
+"""
+
+from app import app, start_categorization_recovery
+from init_db import release_categorization_claims
+
+if __name__ == '__main__':
+    release_categorization_claims()
+    start_categorization_recovery()
+    app.run()